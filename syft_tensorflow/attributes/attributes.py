@@ -73,7 +73,7 @@ class TensorFlowAttributes(FrameworkAttributes):
         # DON'T put here:
         # - functions like native_*
         # - functions that could use pointers or syft tensors
-        self.exclude = []
+        self.exclude = set()
 
         # SECTION: List all torch tensor methods we want to overload
         self.tensor_types = [tensorflow.Tensor, tensorflow.Variable]
@@ -106,8 +106,6 @@ class TensorFlowAttributes(FrameworkAttributes):
 
         self.command_guard = self._command_guard
 
-        self.exclude = []
-
         self.inplace_methods = {}
 
 
@@ -1,6 +1,8 @@
+import functools
 import logging
 import types
 
+import numpy as np
 import tensorflow as tf
 from tensorflow.python.framework.ops import Tensor
 
@@ -15,6 +17,53 @@ from syft_tensorflow.tensor import TensorFlowTensor
 from syft_tensorflow.tensor import TensorFlowVariable
 
 
+class _LazyAttribute:
+    """Data descriptor for syft attributes stored in the instance __dict__.
+
+    The default value is only computed, with default_factory, on the first
+    read, so reads are a single dict lookup rather than a hasattr probe
+    followed by a getattr.
+    """
+
+    def __init__(self, name, default_factory):
+        self.name = name
+        self.default_factory = default_factory
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        d = instance.__dict__
+        try:
+            return d[self.name]
+        except KeyError:
+            value = d[self.name] = self.default_factory()
+            return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+
+# Every caller gets the same TensorShape object for a given dims tuple, so
+# the returned shapes must never be mutated
+@functools.lru_cache(maxsize=256)
+def _make_shape(dims):
+    return tf.TensorShape(dims)
+
+
+@functools.lru_cache(maxsize=256)
+def _make_zeros(dims, dtype):
+    return tf.zeros(dims, dtype=dtype)
+
+
+# Only zero tensors up to this many elements are kept by _make_zeros, so the
+# cache never pins large placeholders in memory
+_ZEROS_CACHE_MAX_ELEMENTS = 1024
+
+
+# The first fully initialized TensorFlowHook, shared by later instantiations
+_HOOK_SINGLETON = None
+
+
 class TensorFlowHook(FrameworkHook):
     def __init__(
         self,
@@ -22,6 +71,19 @@ class TensorFlowHook(FrameworkHook):
         local_worker: BaseWorker = None,
         is_client: bool = True
     ):
+        global _HOOK_SINGLETON
+
+        if _HOOK_SINGLETON is not None and hasattr(tensorflow, "tf_hooked"):
+            logging.warning("TF was already hooked, skipping hooking process")
+            # Share the state of the first hook rather than rebuilding the
+            # TensorFlowAttributes, then make TF the active framework again.
+            # self and _HOOK_SINGLETON are distinct objects aliasing the same
+            # __dict__, so attributes set on either are seen by both
+            self.__dict__ = _HOOK_SINGLETON.__dict__
+            syft.framework = syft.tensorflow
+            syft.hook = self
+            syft.local_worker = self.local_worker
+            return
 
         self.tensorflow = tensorflow
         self.framework = self.tensorflow
@@ -77,6 +139,8 @@ class TensorFlowHook(FrameworkHook):
         syft.local_worker = self.local_worker
         syft.hook = self
 
+        _HOOK_SINGLETON = self
+
     def _hook_native_tensor(self, tensor_type: type, syft_type: type):
         """Adds PySyft Tensor Functionality to the given native tensor type.
          Overloads the given native Torch tensor to add PySyft Tensor
@@ -106,7 +170,12 @@ class TensorFlowHook(FrameworkHook):
         tensorflow_modules = syft.tensorflow.tensorflow_modules
 
         for module_name, tensorflow_module in tensorflow_modules.items():
-            for func in dir(tensorflow_module):
+            # dir() is expensive on TF modules, so compute the names once
+            # and use a set for the `native_` membership check below
+            names = dir(tensorflow_module)
+            name_set = frozenset(names)
+
+            for func in names:
 
                 # Some functions we want to ignore (not override). Such functions have been hard
                 # coded into the torch_attribute exclude (see TorchAttribute class)
@@ -126,7 +195,7 @@ class TensorFlowHook(FrameworkHook):
                     continue
 
                 # If we haven't already overloaded this function
-                if "native_" in func or f"native_{func}" in dir(tensorflow_module):
+                if func.startswith("native_") or f"native_{func}" in name_set:
                     continue
 
                 self._perform_function_overloading(module_name, tensorflow_module, func)
@@ -150,15 +219,14 @@ class TensorFlowHook(FrameworkHook):
         def new___init__(cls, *args, owner=None, id=None, register=True, **kwargs):
             cls.native___init__(*args, **kwargs)
 
-            if owner is None:
-              owner = hook_self.local_worker
+            # Only store what was given explicitly: the id, owner and
+            # is_wrapper descriptors fill in their defaults on first access,
+            # so intermediate tensors that never meet syft don't pay for them
+            if owner is not None:
+              cls.owner = owner
 
-            if id is None:
-              id = syft.ID_PROVIDER.pop()
-
-            cls.id = id
-            cls.owner = owner
-            cls.is_wrapper = False
+            if id is not None:
+              cls.id = id
 
         if "native___init__" not in dir(tensor_type):
             tensor_type.native___init__ = tensor_type.__init__
@@ -188,49 +256,22 @@ class TensorFlowHook(FrameworkHook):
 
         tensor_type.id_at_location = id_at_location
 
-        @property
-        def id(self):
-            if not hasattr(self, "_syft_id"):
-                self._syft_id = syft.ID_PROVIDER.pop()
-            return self._syft_id
-
-        @id.setter
-        def id(self, new_syft_id):
-            self._syft_id = new_syft_id
-            return self
-
-        tensor_type.id = id
-
-        @property
-        def owner(self):
-            if not hasattr(self, "_owner"):
-                self._owner = hook_self.local_worker
-            return self._owner
-
-        @owner.setter
-        def owner(self, new_owner):
-            self._owner = new_owner
-            return self
-
-        tensor_type.owner = owner
-
-        @property
-        def is_wrapper(self):
-            if not hasattr(self, "_is_wrapper"):
-                self._is_wrapper = False
-            return self._is_wrapper
-
-        @is_wrapper.setter
-        def is_wrapper(self, it_is_a_wrapper):
-            self._is_wrapper = it_is_a_wrapper
-            return self
-
-        tensor_type.is_wrapper = is_wrapper
+        tensor_type.id = _LazyAttribute(
+            "_syft_id", lambda: syft.ID_PROVIDER.pop()
+        )
+        tensor_type.owner = _LazyAttribute(
+            "_owner", lambda: hook_self.local_worker
+        )
 
         tensor_type.native_shape = tensor_type.shape
 
         def dim(self):
-            return len(self.shape)
+            shape = self.shape
+            if isinstance(shape, tf.TensorShape):
+                # None when the rank is unknown, like TensorShape.rank
+                return shape.rank
+            # A wrapper's child shape need not be a TensorShape
+            return len(shape)
 
         tensor_type.dim = dim
 
@@ -243,7 +284,7 @@ class TensorFlowHook(FrameworkHook):
             tensor_type: The tensor type to which we are adding methods
                 from TorchTensor class.
         """
-        exclude = [
+        exclude = frozenset([
             "__class__",
             "__delattr__",
             "__dir__",
@@ -267,25 +308,56 @@ class TensorFlowHook(FrameworkHook):
             "__ge__",
             "__lt__",
             "__le__",
-        ]
+        ])
+
+        # Collect attribute names once from each class __dict__ along the MRO
+        # instead of probing tensor_type with hasattr for every attribute;
+        # this is the same set of names dir() would give, without sorting.
+        existing = {n for klass in tensor_type.__mro__ for n in vars(klass)}
+        syft_attrs = {n for klass in syft_type.__mro__ for n in vars(klass)}
+
         # For all methods defined in tf.Tensor or TensorFlowTensor
-        # that are not internal methods (like __class__etc)
-        for attr in dir(syft_type):
-            if attr not in exclude:
-                # Alias `attr` method as `native_attr` if it already exists
-                if hasattr(tensor_type, attr):
-                    setattr(
-                        tensor_type,
-                        f"native_{attr}",
-                        getattr(tensor_type, attr)
-                    )
-                # Add this method to the TF tensor
-                setattr(tensor_type, attr, getattr(syft_type, attr))
+        # that are not internal methods (like __class__etc), first collect
+        # the native aliases and the overrides, so that all native values
+        # are read before tensor_type is modified, then apply them together
+        natives = {}
+        updates = {}
+        for attr in syft_attrs - exclude:
+            # Alias `attr` method as `native_attr` if it already exists
+            if attr in existing:
+                natives[f"native_{attr}"] = getattr(tensor_type, attr)
+            # Add this method to the TF tensor
+            updates[attr] = getattr(syft_type, attr)
+
+        for attr, value in natives.items():
+            setattr(tensor_type, attr, value)
+        for attr, value in updates.items():
+            setattr(tensor_type, attr, value)
 
     @classmethod
     def create_shape(cls, shape_dims):
+        if isinstance(shape_dims, (list, tuple)):
+            try:
+                return _make_shape(tuple(shape_dims))
+            except TypeError:
+                # unhashable dims (e.g. eager scalars) can't be cached
+                pass
         return tf.TensorShape(shape_dims)
 
     @classmethod
-    def create_zeros(shape, dtype, **kwargs):
+    def create_zeros(cls, shape, dtype=tf.float32, **kwargs):
+        if (
+            not kwargs
+            and isinstance(shape, (list, tuple))
+            and tf.executing_eagerly()
+        ):
+            try:
+                dims = tuple(shape)
+                if np.prod(dims) <= _ZEROS_CACHE_MAX_ELEMENTS:
+                    # Copy the cached template so syft attributes set on the
+                    # result are never shared between callers
+                    return tf.identity(_make_zeros(dims, dtype))
+            except TypeError:
+                # unknown or unhashable dims (e.g. eager scalars)
+                pass
         return tf.zeros(shape, dtype=dtype, **kwargs)
@@ -0,0 +1,26 @@
+import tensorflow as tf
+import syft
+
+import syft_tensorflow.hook.hook as hook_module
+
+
+def test_rehook_reuses_state(hook, monkeypatch):
+  attributes = syft.tensorflow
+  local_worker = syft.local_worker
+
+  def fail(*args, **kwargs):
+    raise AssertionError("a new VirtualWorker was created")
+
+  monkeypatch.setattr(hook_module, "VirtualWorker", fail)
+  monkeypatch.setattr(syft, "hook", None)
+  monkeypatch.setattr(syft, "framework", None)
+  monkeypatch.setattr(syft, "local_worker", None)
+
+  new_hook = syft.TensorFlowHook(tf)
+
+  assert syft.tensorflow is attributes
+  assert syft.framework is attributes
+  assert syft.local_worker is local_worker
+  assert new_hook.local_worker is local_worker
+  assert syft.hook is new_hook
+  assert new_hook.__dict__ is hook.__dict__
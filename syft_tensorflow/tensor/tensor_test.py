@@ -3,6 +3,8 @@ import tensorflow as tf
 import syft
 import numpy as np
 
+import syft_tensorflow.hook.hook as hook_module
+
 
 def test_send_get_constant(remote):
     x_to_give = tf.constant(2.0)
@@ -17,3 +19,95 @@ def test_add(remote):
   z = z_ptr.get()
 
   assert tf.math.equal(z, tf.constant(5.0))
+
+
+def test_id_uses_given_ids():
+  syft.ID_PROVIDER.set_next_ids([1234567])
+  try:
+    x = tf.constant(2.0)
+    assert x.id == 1234567
+    assert tf.constant(3.0).id != x.id
+  finally:
+    # don't leak the queued id into later tests if an assertion failed
+    if 1234567 in syft.ID_PROVIDER.given_ids:
+      syft.ID_PROVIDER.given_ids.remove(1234567)
+
+
+def test_id_assigned_on_first_access():
+  x = tf.constant(2.0)
+  assert "_syft_id" not in x.__dict__
+  x_id = x.id
+  assert x.__dict__["_syft_id"] == x_id
+  assert x.id == x_id
+
+
+def test_init_stores_explicit_id_and_owner(remote):
+  with tf.Graph().as_default():
+    c = tf.constant(2.0)
+    t = tf.Tensor(c.op, 0, tf.float32, id=1234568, owner=remote)
+    default = tf.Tensor(c.op, 0, tf.float32)
+
+  assert t.id == 1234568
+  assert t.owner is remote
+  assert "_syft_id" not in default.__dict__
+  assert "_owner" not in default.__dict__
+
+
+def test_create_zeros_and_shape():
+  zeros = syft.hook.create_zeros([2, 3])
+  other = syft.hook.create_zeros([2, 3])
+  assert zeros.shape == tf.TensorShape([2, 3])
+  assert zeros.dtype == tf.float32
+  assert zeros is not other
+  assert tf.math.reduce_all(tf.math.equal(zeros, other))
+
+  ints = syft.hook.create_zeros([2, 3], tf.int32)
+  assert ints.dtype == tf.int32
+
+  scalar_dims = syft.hook.create_zeros([tf.constant(2), 3], tf.float32)
+  assert scalar_dims.shape == tf.TensorShape([2, 3])
+
+  shape = syft.hook.create_shape([2, 3])
+  assert isinstance(shape, tf.TensorShape)
+  assert shape.as_list() == [2, 3]
+
+
+def test_create_zeros_and_shape_use_cache():
+  syft.hook.create_zeros([2, 3])
+  hits = hook_module._make_zeros.cache_info().hits
+  syft.hook.create_zeros([2, 3])
+  assert hook_module._make_zeros.cache_info().hits == hits + 1
+
+  syft.hook.create_shape([2, 3])
+  hits = hook_module._make_shape.cache_info().hits
+  syft.hook.create_shape([2, 3])
+  assert hook_module._make_shape.cache_info().hits == hits + 1
+
+
+def test_create_zeros_bypasses_cache():
+  info = hook_module._make_zeros.cache_info()
+
+  # over _ZEROS_CACHE_MAX_ELEMENTS
+  big = syft.hook.create_zeros([hook_module._ZEROS_CACHE_MAX_ELEMENTS + 1])
+  assert big.shape == tf.TensorShape([hook_module._ZEROS_CACHE_MAX_ELEMENTS + 1])
+  assert hook_module._make_zeros.cache_info() == info
+
+  # graph mode
+  @tf.function
+  def make_zeros():
+    return syft.hook.create_zeros([2, 3])
+
+  assert make_zeros().shape == tf.TensorShape([2, 3])
+  assert hook_module._make_zeros.cache_info() == info
+
+
+def test_dim():
+  assert tf.constant(2.0).dim() == 0
+  assert tf.constant([[1.0, 2.0], [3.0, 4.0]]).dim() == 2
+
+
+def test_dim_unknown_rank():
+  with tf.Graph().as_default():
+    x = tf.compat.v1.placeholder(tf.float32, shape=None)
+    assert x.shape.rank is None
+    assert x.dim() is None
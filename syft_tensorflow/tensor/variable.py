@@ -51,9 +51,7 @@ class TensorFlowVariable(AbstractTensor):
         if self.has_child():
             return self.child.tags
         else:
-            if not hasattr(self, "_tags"):
-                self._tags = None
-            return self._tags
+            return self.__dict__.get("_tags")
 
     @tags.setter
     def tags(self, new_tags):
@@ -70,9 +68,7 @@ class TensorFlowVariable(AbstractTensor):
         if self.has_child():
             return self.child.description
         else:
-            if not hasattr(self, "_description"):
-                self._description = None
-            return self._description
+            return self.__dict__.get("_description")
 
     @description.setter
     def description(self, new_desc):
@@ -14,3 +14,7 @@ def test_add_variables(remote):
   z_ptr = x + y
   z = z_ptr.get()
   assert np.array_equal(z.numpy(), [5., 5.])
+
+def test_dim_variable():
+  assert tf.Variable(2.0).dim() == 0
+  assert tf.Variable([[1.0, 2.0], [3.0, 4.0]]).dim() == 2